@@ -81,6 +81,13 @@ impl Emulator {
             )
             .unwrap();
 
+        // computes the (loop invariant) number of cycles to be run
+        // per logic tick and the frequency of such ticks, these values
+        // only depend on the logic ratio of the emulator
+        let cycle_limit = (GameBoy::LCD_CYCLES as f32 / self.logic_ratio as f32) as u32;
+        let logic_frequency =
+            GameBoy::CPU_FREQ as f32 / GameBoy::LCD_CYCLES as f32 * self.logic_ratio;
+
         // allocates space for the loop ticks counter to be used in each
         // iteration cycle
         let mut counter = 0u32;
@@ -126,8 +133,6 @@ impl Emulator {
             let mut last_frame = 0xffffu16;
 
             if current_time >= self.next_tick_time_i {
-                let cycle_limit = (GameBoy::LCD_CYCLES as f32 / self.logic_ratio as f32) as u32;
-
                 loop {
                     // limits the number of ticks to the typical number
                     // of cycles expected for the current logic cycle
@@ -135,9 +140,11 @@ impl Emulator {
                         break;
                     }
 
-                    // runs the Game Boy clock, this operations should
-                    // include the advance of both the CPU and the PPU
-                    counter_cycles += self.system.clock() as u32;
+                    // runs the Game Boy clock until either the V-Blank is
+                    // reached or the remaining cycles are consumed, this
+                    // operation should include the advance of both the CPU
+                    // and the PPU (batched in a single call per frame)
+                    counter_cycles += self.system.clocks_vblank(cycle_limit - counter_cycles);
 
                     if self.system.ppu_mode() == PpuMode::VBlank
                         && self.system.ppu_frame() != last_frame
@@ -165,9 +172,6 @@ impl Emulator {
                     }
                 }
 
-                let logic_frequency =
-                    GameBoy::CPU_FREQ as f32 / GameBoy::LCD_CYCLES as f32 * self.logic_ratio;
-
                 // updates the next update time reference to the current
                 // time so that it can be used from game loop control
                 self.next_tick_time += 1000.0 / logic_frequency as f32;
@@ -11,7 +11,7 @@ import {
     RomInfo,
     Size
 } from "emukit";
-import { PALETTES, PALETTES_MAP } from "./palettes";
+import { PALETTES, PALETTES_BYTES, PALETTES_INDEX } from "./palettes";
 import { base64ToBuffer, bufferToBase64 } from "./util";
 import { HelpFaqs, HelpKeyboard } from "../react";
 
@@ -36,6 +36,12 @@ const DISPLAY_WIDTH = 160;
 const DISPLAY_HEIGHT = 144;
 const DISPLAY_SCALE = 2;
 
+/**
+ * The size in bytes of the RGB frame buffer (3 bytes per pixel)
+ * as stored in the WASM memory of the emulator.
+ */
+const FRAME_BUFFER_SIZE = DISPLAY_WIDTH * DISPLAY_HEIGHT * 3;
+
 /**
  * The rate at which the local storage RAM state flush
  * operation is going to be performed, this value is the
@@ -88,11 +94,17 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
     private paused = false;
     private nextTickTime = 0;
     private fps = 0;
-    private frameStart: number = new Date().getTime();
+    private frameStart: number = performance.now();
     private frameCount = 0;
     private paletteIndex = 0;
     private storeCycles: number = LOGIC_HZ * STORE_RATE;
 
+    /**
+     * Cached view over the frame buffer in the WASM memory, should
+     * only be re-created when the engine or the memory changes.
+     */
+    private frameBufferView: Uint8Array | null = null;
+
     private romName: string | null = null;
     private romData: Uint8Array | null = null;
     private romSize = 0;
@@ -223,6 +235,15 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
         );
         ticks = Math.max(ticks, 1);
 
+        // obtains a local reference to the Game Boy instance so that
+        // the (hot) loop does not have to re-resolve the property
+        const gameBoy = this.gameBoy;
+        if (!gameBoy) return pending;
+
+        // determines once per tick if the cartridge is battery backed
+        // avoiding the branching and engine call on each iteration
+        const hasBattery = this.cartridge?.has_battery() ?? false;
+
         // initializes the counter of cycles with the pending number
         // of cycles coming from the previous tick
         let counterCycles = pending;
@@ -236,31 +257,35 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
                 break;
             }
 
-            // runs the Game Boy clock, this operations should
-            // include the advance of both the CPU and the PPU
-            const tickCycles = this.gameBoy?.clock() ?? 0;
+            // runs the Game Boy clock until either the V-Blank is
+            // reached or the remaining cycles are consumed, this
+            // operation should include the advance of both the CPU
+            // and the PPU (batched to avoid per instruction calls)
+            const tickCycles = gameBoy.clocks_vblank(cycles - counterCycles);
             counterCycles += tickCycles;
 
             // in case the current PPU mode is VBlank and the
             // frame is different from the previously rendered
-            // one then it's time to update the canvas
-            if (
-                this.gameBoy?.ppu_mode() === PpuMode.VBlank &&
-                this.gameBoy?.ppu_frame() !== lastFrame
-            ) {
-                // updates the reference to the last frame index
-                // to be used for comparison in the next tick
-                lastFrame = this.gameBoy?.ppu_frame();
-
-                // triggers the frame event indicating that
-                // a new frame is now available for drawing
-                this.trigger("frame");
+            // one then it's time to update the canvas, notice
+            // that the frame index is only obtained once
+            if (gameBoy.ppu_mode() === PpuMode.VBlank) {
+                const frame = gameBoy.ppu_frame();
+                if (frame !== lastFrame) {
+                    // updates the reference to the last frame index
+                    // to be used for comparison in the next tick
+                    lastFrame = frame;
+
+                    // triggers the frame event indicating that
+                    // a new frame is now available for drawing
+                    // (the frame buffer view is kept cached)
+                    this.trigger("frame");
+                }
             }
 
             // in case the current cartridge is battery backed
             // then we need to check if a RAM flush to local
             // storage operation is required
-            if (this.cartridge && this.cartridge.has_battery()) {
+            if (hasBattery) {
                 this.storeCycles -= tickCycles;
                 if (this.storeCycles <= 0) {
                     this.storeRam();
@@ -277,7 +302,7 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
         // has been reached calculates the number of FPS and
         // flushes the value to the screen
         if (this.frameCount >= this.visualFrequency * FPS_SAMPLE_RATE) {
-            const currentTime = new Date().getTime();
+            const currentTime = performance.now();
             const deltaTime = (currentTime - this.frameStart) / 1000;
             const fps = Math.round(this.frameCount / deltaTime);
             this.fps = fps;
@@ -348,6 +373,10 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
                 break;
         }
 
+        // invalidates the frame buffer view as the engine
+        // may have changed (new memory location)
+        this.frameBufferView = null;
+
         // runs the initial palette update operation, restoring
         // the palette of the emulator according to the currently
         // selected one
@@ -473,10 +502,29 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
      * Returns the array buffer that contains the complete set of
      * pixel data that is going to be drawn.
      *
+     * The buffer is a view over the WASM memory of the emulator
+     * (no copy is performed), meaning that its contents change
+     * as the emulator keeps running.
+     *
      * @returns The current pixel data for the emulator display.
      */
     get imageBuffer(): Uint8Array {
-        return this.gameBoy?.frame_buffer_eager() ?? new Uint8Array();
+        if (!this.gameBoy || !memory) return new Uint8Array();
+
+        // re-creates the view in case there's none or in case the
+        // WASM memory has grown (previous buffer is detached)
+        if (
+            this.frameBufferView === null ||
+            this.frameBufferView.buffer !== memory.buffer
+        ) {
+            this.frameBufferView = new Uint8Array(
+                memory.buffer,
+                this.gameBoy.frame_buffer_ptr(),
+                FRAME_BUFFER_SIZE
+            );
+        }
+
+        return this.frameBufferView;
     }
 
     get romInfo(): RomInfo {
@@ -543,8 +591,7 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
 
     set palette(value: string | undefined) {
         if (value === undefined) return;
-        const paletteObj = PALETTES_MAP[value];
-        this.paletteIndex = Math.max(PALETTES.indexOf(paletteObj), 0);
+        this.paletteIndex = PALETTES_INDEX[value] ?? 0;
         this.updatePalette();
     }
 
@@ -596,11 +643,11 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
         let cycles = 0;
         this.pause();
         try {
-            const initial = Date.now();
+            const initial = performance.now();
             for (let i = 0; i < count; i++) {
                 cycles += this.gameBoy?.clock() ?? 0;
             }
-            const delta = (Date.now() - initial) / 1000;
+            const delta = (performance.now() - initial) / 1000;
             const frequency_mhz = cycles / delta / 1000 / 1000;
             return {
                 delta: delta,
@@ -653,8 +700,10 @@ export class GameboyEmulator extends EmulatorBase implements Emulator {
     }
 
     private updatePalette() {
-        const palette = PALETTES[this.paletteIndex];
-        this.gameBoy?.set_palette_colors_ws(palette.colors);
+        // uses the pre-computed RGB bytes of the palette so that
+        // no hex string parsing is done on each palette change
+        const paletteBytes = PALETTES_BYTES[this.paletteIndex];
+        this.gameBoy?.set_palette_colors_bytes_ws(paletteBytes);
         this.storeSettings();
     }
 
@@ -694,7 +743,13 @@ window.panic = (message: string) => {
     console.error(message);
 };
 
+/**
+ * The linear memory of the WASM module, used to create
+ * views over buffers of the emulator without copying them.
+ */
+let memory: WebAssembly.Memory | null = null;
+
 const wasm = async () => {
-    await _wasm();
+    ({ memory } = await _wasm());
     GameBoy.set_panic_hook_ws();
 };
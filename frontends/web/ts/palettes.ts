@@ -29,6 +29,15 @@ export const PALETTES = [
     }
 ];
 
-export const PALETTES_MAP = Object.fromEntries(
-    PALETTES.map((v) => [v.name, v])
+export const PALETTES_INDEX: Record<string, number> = Object.fromEntries(
+    PALETTES.map((v, i) => [v.name, i])
+);
+
+export const PALETTES_BYTES = PALETTES.map(
+    (v) =>
+        new Uint8Array(
+            v.colors.flatMap((c) =>
+                [0, 2, 4].map((i) => parseInt(c.slice(i, i + 2), 16))
+            )
+        )
 );
@@ -8,8 +8,7 @@ def print_buffer(filename):
     try: data = file.read()
     finally: file.close()
 
-    buffer = [str(byte) for byte in data]
-    buffer_s = ", ".join(buffer)
+    buffer_s = ", ".join(map(str, data))
 
     print("[%s]" % buffer_s)
 
@@ -13,7 +13,7 @@ use crate::{
 use wasm_bindgen::prelude::*;
 
 #[cfg(feature = "wasm")]
-use crate::ppu::{Palette, Pixel};
+use crate::ppu::{Palette, Pixel, PALETTE_SIZE, RGB_SIZE};
 
 #[cfg(feature = "wasm")]
 use std::{
@@ -73,6 +73,52 @@ impl GameBoy {
         cycles
     }
 
+    /// Runs the machine clock until the PPU finishes the
+    /// current frame, returning the number of cycles taken.
+    /// In case the LCD is off the run is limited to the
+    /// number of cycles of a complete frame.
+    pub fn next_frame(&mut self) -> u32 {
+        let mut cycles = 0u32;
+        let current_frame = self.ppu_frame();
+        loop {
+            cycles += self.clock() as u32;
+            if self.ppu_frame() != current_frame || cycles >= Self::LCD_CYCLES {
+                break;
+            }
+        }
+        cycles
+    }
+
+    /// Runs the provided number of frames in a single call,
+    /// avoiding the call overhead of running them one by one
+    /// from the outside (eg: JavaScript through WASM).
+    /// The cycles are accumulated as 64 bit as large counts
+    /// of frames would overflow a 32 bit value.
+    pub fn next_frames(&mut self, count: u32) -> u64 {
+        let mut cycles = 0u64;
+        for _ in 0..count {
+            cycles += self.next_frame() as u64;
+        }
+        cycles
+    }
+
+    /// Runs the machine clock until either the provided limit
+    /// of cycles is reached or the PPU enters the V-Blank mode,
+    /// returning the number of cycles taken.
+    /// Allows the (frame) drawing loop to be run with a reduced
+    /// number of calls, as a call is only required per frame.
+    pub fn clocks_vblank(&mut self, limit: u32) -> u32 {
+        let mut cycles = 0u32;
+        loop {
+            let was_vblank = self.ppu_mode() == PpuMode::VBlank;
+            cycles += self.clock() as u32;
+            if cycles >= limit || (!was_vblank && self.ppu_mode() == PpuMode::VBlank) {
+                break;
+            }
+        }
+        cycles
+    }
+
     pub fn key_press(&mut self, key: PadKey) {
         self.pad().key_press(key);
     }
@@ -105,6 +151,18 @@ impl GameBoy {
         self.ppu().frame_index()
     }
 
+    pub fn ppu_render_enabled(&mut self) -> bool {
+        self.ppu().render_enabled()
+    }
+
+    /// Enables or disables the rendering of the PPU into the frame
+    /// buffer, useful for headless execution (eg: testing) where
+    /// the frame buffer is not used, its contents are undefined
+    /// while the rendering is disabled.
+    pub fn set_ppu_render_enabled(&mut self, value: bool) {
+        self.ppu().set_render_enabled(value);
+    }
+
     pub fn boot(&mut self) {
         self.cpu.boot();
     }
@@ -147,6 +205,15 @@ impl GameBoy {
         self.frame_buffer().to_vec()
     }
 
+    /// Obtains the pointer to the start of the RGB frame buffer,
+    /// under WASM this is an offset in the linear memory that
+    /// allows the creation of a view over the buffer with no copy.
+    /// The frame buffer is stable in memory for the lifetime of
+    /// the Game Boy instance (including resets).
+    pub fn frame_buffer_ptr(&mut self) -> *const u8 {
+        self.frame_buffer().as_ptr()
+    }
+
     pub fn cartridge_eager(&mut self) -> Cartridge {
         self.mmu().rom().clone()
     }
@@ -295,6 +362,17 @@ impl GameBoy {
         self.ppu().set_palette_colors(&palette);
     }
 
+    /// Sets the palette colors from a buffer of sequential RGB
+    /// bytes (one pixel per color), avoiding the parsing of the
+    /// hex strings required by `set_palette_colors_ws()`.
+    pub fn set_palette_colors_bytes_ws(&mut self, value: &[u8]) {
+        let mut palette: Palette = [[0u8; RGB_SIZE]; PALETTE_SIZE];
+        for (pixel, color) in palette.iter_mut().zip(value.chunks_exact(RGB_SIZE)) {
+            pixel.copy_from_slice(color);
+        }
+        self.ppu().set_palette_colors(&palette);
+    }
+
     fn js_to_pixel(value: &JsValue) -> Pixel {
         value
             .as_string()
@@ -328,3 +406,77 @@ impl Default for GameBoy {
         Self::new()
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::GameBoy;
+    use crate::ppu::PpuMode;
+
+    #[test]
+    fn test_next_frames() {
+        let mut game_boy = GameBoy::new();
+        game_boy.load_boot_default();
+        game_boy.load_rom_file("res/roms/opus5.gb");
+
+        let cycles = game_boy.next_frames(10);
+        assert!(cycles >= GameBoy::LCD_CYCLES as u64 * 9);
+        assert!(game_boy.ppu_frame() > 0);
+    }
+
+    #[test]
+    fn test_next_frames_large() {
+        let mut game_boy = GameBoy::new();
+        game_boy.set_ppu_render_enabled(false);
+        game_boy.load_boot_default();
+        game_boy.load_rom_file("res/roms/opus5.gb");
+
+        let cycles = game_boy.next_frames(61200);
+        assert!(cycles > u32::MAX as u64);
+    }
+
+    #[test]
+    fn test_next_frames_headless() {
+        let mut game_boy = GameBoy::new();
+        game_boy.set_ppu_render_enabled(false);
+        game_boy.load_boot_default();
+        game_boy.load_rom_file("res/roms/opus5.gb");
+
+        game_boy.next_frames(120);
+        let frame_buffer = game_boy.frame_buffer();
+        assert!(frame_buffer.iter().all(|v| *v == frame_buffer[0]));
+    }
+
+    #[test]
+    fn test_clocks_vblank() {
+        let mut game_boy = GameBoy::new();
+        game_boy.load_boot_default();
+        game_boy.load_rom_file("res/roms/opus5.gb");
+
+        // runs frames until the LCD is switched on, as otherwise
+        // the PPU is stopped and the V-Blank is never reached
+        for _ in 0..100 {
+            if game_boy.mmu().read(0xff40) & 0x80 == 0x80 {
+                break;
+            }
+            game_boy.next_frame();
+        }
+        assert_eq!(game_boy.mmu().read(0xff40) & 0x80, 0x80);
+
+        // the run must stop at the V-Blank entry, way before the limit
+        let limit = GameBoy::LCD_CYCLES * 4;
+        let cycles = game_boy.clocks_vblank(limit);
+        assert!(cycles < limit);
+        assert!(game_boy.ppu_mode() == PpuMode::VBlank);
+        assert_eq!(game_boy.ppu_ly(), 144);
+
+        // starting inside V-Blank the run must go through the
+        // rest of the frame until the next V-Blank entry
+        let frame = game_boy.ppu_frame();
+        let cycles = game_boy.clocks_vblank(limit);
+        assert!(cycles < limit);
+        assert!(cycles > GameBoy::LCD_CYCLES - 456);
+        assert!(game_boy.ppu_mode() == PpuMode::VBlank);
+        assert_eq!(game_boy.ppu_ly(), 144);
+        assert_eq!(game_boy.ppu_frame(), frame.wrapping_add(1));
+    }
+}
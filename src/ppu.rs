@@ -274,6 +274,11 @@ pub struct Ppu {
     /// the identifier wraps on the u16 edges.
     frame_index: u16,
 
+    /// Flag that controls if the lines are rendered into the frame
+    /// buffer, disabling it (headless mode) keeps the timing and the
+    /// interrupts of the PPU while skipping the pixel pipeline.
+    render_enabled: bool,
+
     stat_hblank: bool,
     stat_vblank: bool,
     stat_oam: bool,
@@ -340,6 +345,7 @@ impl Ppu {
             window_counter: 0x0,
             first_frame: false,
             frame_index: 0,
+            render_enabled: true,
             stat_hblank: false,
             stat_vblank: false,
             stat_oam: false,
@@ -350,8 +356,10 @@ impl Ppu {
     }
 
     pub fn reset(&mut self) {
-        self.color_buffer = Box::new([0u8; COLOR_BUFFER_SIZE]);
-        self.frame_buffer = Box::new([0u8; FRAME_BUFFER_SIZE]);
+        // clears the buffers in place so that their memory location
+        // is kept stable (views may exist over the frame buffer)
+        self.color_buffer.fill(0);
+        self.frame_buffer.fill(0);
         self.vram = [0u8; VRAM_SIZE];
         self.hram = [0u8; HRAM_SIZE];
         self.tiles = [Tile { buffer: [0u8; 64] }; TILE_COUNT];
@@ -403,7 +411,9 @@ impl Ppu {
             }
             PpuMode::VramRead => {
                 if self.mode_clock >= 172 {
-                    self.render_line();
+                    if self.render_enabled {
+                        self.render_line();
+                    }
 
                     self.mode = PpuMode::HBlank;
                     self.mode_clock -= 172;
@@ -616,6 +626,14 @@ impl Ppu {
         self.frame_index
     }
 
+    pub fn render_enabled(&self) -> bool {
+        self.render_enabled
+    }
+
+    pub fn set_render_enabled(&mut self, value: bool) {
+        self.render_enabled = value;
+    }
+
     pub fn int_vblank(&self) -> bool {
         self.int_vblank
     }